@@ -1,6 +1,6 @@
 """Base agent module defining the Agent interface and common functionality."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
 import logging
 from dataclasses import dataclass
@@ -37,6 +37,7 @@ class Agent(ABC):
         self.name = name
         self.description = description
         self._state = AgentState()
+        self._config_cache: Optional[Dict[str, Any]] = None
         logger.info(f"Initialized agent: {name}")
 
     @abstractmethod
@@ -68,7 +69,9 @@ class Agent(ABC):
         if "metadata" in updates:
             self._state.metadata.update(updates["metadata"])
 
-        logger.debug(f"Updated state for {self.name}: {self._state}")
+        self._config_cache = None
+        # Lazy formatting: the state repr is only built when DEBUG is on
+        logger.debug("Updated state for %s: %s", self.name, self._state)
 
     def get_state(self) -> AgentState:
         """Get the current state of the agent.
@@ -81,20 +84,28 @@ class Agent(ABC):
     def reset(self) -> None:
         """Reset the agent state to its initial values."""
         self._state = AgentState()
+        self._config_cache = None
         logger.info(f"Reset state for agent: {self.name}")
 
     @property
     def config(self) -> Dict[str, Any]:
         """Get the agent configuration.
 
+        The dict is memoized behind a dirty flag so repeated reads don't
+        rebuild it; `update_state` and `reset` invalidate the cache. A
+        shallow copy is returned so callers mutating the result can't
+        corrupt the cached dict.
+
         Returns:
             Dictionary containing agent configuration
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "current_state": self._state.current_step
-        }
+        if self._config_cache is None:
+            self._config_cache = {
+                "name": self.name,
+                "description": self.description,
+                "current_state": self._state.current_step
+            }
+        return dict(self._config_cache)
 
     def __repr__(self) -> str:
         """Return a string representation of the agent."""
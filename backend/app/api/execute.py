@@ -1,12 +1,31 @@
+import asyncio
+import weakref
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from pydantic import BaseModel
 
+from app.config import config
 from app.workflow.orchestrator import WorkflowOrchestrator
 
 router = APIRouter()
 orchestrator = WorkflowOrchestrator()
 
+# Cap in-flight workflow executions so a traffic burst can't schedule an
+# unbounded number of orchestrations and starve the event loop. Semaphores
+# bind to the loop they are first awaited on, so one is kept per loop.
+_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _execution_semaphore() -> asyncio.Semaphore:
+    """Get the execution semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(
+            config.workflow.max_concurrent_executions)
+        _semaphores[loop] = semaphore
+    return semaphore
+
 
 class ExecuteRequest(BaseModel):
     """Request model for workflow execution."""
@@ -18,10 +37,11 @@ class ExecuteRequest(BaseModel):
 async def execute_workflow(request: ExecuteRequest):
     """Execute a workflow with the given input data."""
     try:
-        result = await orchestrator.execute_workflow(
-            workflow_id=request.workflow_id,
-            input_data=request.input_data
-        )
+        async with _execution_semaphore():
+            result = await orchestrator.execute_workflow(
+                workflow_id=request.workflow_id,
+                input_data=request.input_data
+            )
         return result
     except Exception as e:
         raise HTTPException(
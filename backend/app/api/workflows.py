@@ -1,106 +1,418 @@
 """API endpoints for workflow management."""
 
-from fastapi import APIRouter, HTTPException
-from app.database import get_db
-from app.schemas.workflow import WorkflowList, WorkflowDetail
-import json
-from typing import List, Dict, Any
+from fastapi import (APIRouter, BackgroundTasks, HTTPException, Request,
+                     Response)
+from fastapi.responses import StreamingResponse
+from app.api.execute import _execution_semaphore
+from app.config import config
+from app.database import get_db, db
+from app.schemas.workflow import (WorkflowCreate, WorkflowDetail,
+                                  WorkflowResponse)
+from app.workflow.orchestrator import WorkflowOrchestrator
+import hashlib
+import logging
+import orjson
+import os
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
+# Predefined workflow templates. The payload is fully static, so the JSON
+# bytes and ETag are computed once at import time and reused per request.
+WORKFLOW_TEMPLATES = [
+    {
+        "id": "data-analysis",
+        "name": "Data Analysis Workflow",
+        "description": "Analyze data sets and generate insights",
+        "steps": [
+            {"name": "Research", "agent": "Researcher",
+                "description": "Gather relevant data"},
+            {"name": "Process", "agent": "Processor",
+                "description": "Process and analyze data"},
+            {"name": "Approve", "agent": "Approver",
+                "description": "Validate analysis results"},
+            {"name": "Optimize", "agent": "Optimizer",
+                "description": "Suggest improvements"}
+        ]
+    },
+    {
+        "id": "content-generation",
+        "name": "Content Generation Workflow",
+        "description": "Generate and optimize content based on requirements",
+        "steps": [
+            {"name": "Research", "agent": "Researcher",
+                "description": "Research topic and gather information"},
+            {"name": "Process", "agent": "Processor",
+                "description": "Generate initial content draft"},
+            {"name": "Approve", "agent": "Approver",
+                "description": "Review and approve content"},
+            {"name": "Optimize", "agent": "Optimizer",
+                "description": "Optimize content for engagement"}
+        ]
+    },
+    {
+        "id": "customer-support",
+        "name": "Customer Support Workflow",
+        "description": "Handle customer inquiries and support tickets",
+        "steps": [
+            {"name": "Research", "agent": "Researcher",
+                "description": "Research customer history and issue"},
+            {"name": "Process", "agent": "Processor",
+                "description": "Generate response or solution"},
+            {"name": "Approve", "agent": "Approver",
+                "description": "Review and approve response"},
+            {"name": "Optimize", "agent": "Optimizer",
+                "description": "Suggest improvements to process"}
+        ]
+    }
+]
+
+_TEMPLATES_JSON = orjson.dumps(WORKFLOW_TEMPLATES)
+_TEMPLATES_ETAG = hashlib.md5(_TEMPLATES_JSON).hexdigest()
+_TEMPLATES_CACHE_CONTROL = "public, max-age=3600"
+
+# SQL statements used by the handlers below. Keeping each as a single
+# module-level string means every request reuses the same compiled
+# statement from the connection's prepared-statement cache.
+# Project only the columns each endpoint returns; SELECT * would drag
+# the potentially large result blob over the wire on every list row.
+_LIST_COLUMNS = "id, name, description, status, created_at, updated_at"
+_LIST_WORKFLOWS_SQL = f"SELECT {_LIST_COLUMNS} FROM workflows"
+_LIST_WORKFLOWS_LIMIT_SQL = f"""
+    SELECT {_LIST_COLUMNS} FROM workflows
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
+# Keyset pages use the composite (created_at, id): timestamps have
+# one-second granularity, so created_at alone would skip rows created in
+# the same second as the boundary and leave within-second order unstable
+_LIST_WORKFLOWS_PAGE_SQL = f"""
+    SELECT {_LIST_COLUMNS} FROM workflows
+    WHERE (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
+_GET_WORKFLOW_SQL = f"""
+    SELECT {_LIST_COLUMNS}, result, error FROM workflows WHERE id = ?
+"""
+_DELETE_WORKFLOW_SQL = "DELETE FROM workflows WHERE id = ?"
+
+# In-process TTL/LRU cache for workflow-by-ID reads. Workflow rows change
+# rarely once completed, so a short TTL saves a DB round-trip on repeat
+# reads while keeping staleness bounded.
+_CACHE_TTL_SECONDS = 30.0
+_CACHE_MAX_ENTRIES = 10_000
+_workflow_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _cache_get(workflow_id: str) -> Optional[Dict[str, Any]]:
+    """Return a cached workflow detail, or None if missing or expired."""
+    entry = _workflow_cache.get(workflow_id)
+    if entry is None:
+        return None
+    expires, detail = entry
+    if time.monotonic() >= expires:
+        del _workflow_cache[workflow_id]
+        return None
+    _workflow_cache.move_to_end(workflow_id)
+    return detail
+
+
+def _cache_put(workflow_id: str, detail: Dict[str, Any]) -> None:
+    """Cache a workflow detail, evicting the oldest entry when full."""
+    _workflow_cache[workflow_id] = (
+        time.monotonic() + _CACHE_TTL_SECONDS, detail)
+    _workflow_cache.move_to_end(workflow_id)
+    if len(_workflow_cache) > _CACHE_MAX_ENTRIES:
+        _workflow_cache.popitem(last=False)
+
+
+def _cache_invalidate(workflow_id: str) -> None:
+    """Drop a workflow from the cache after a delete or update."""
+    _workflow_cache.pop(workflow_id, None)
+
+
+def _workflow_summary(workflow) -> Dict[str, Any]:
+    """Project a workflow row onto the list-endpoint shape."""
+    return {
+        "id": workflow["id"],
+        "name": workflow["name"],
+        "description": workflow["description"],
+        "status": workflow["status"],
+        "created_at": workflow["created_at"],
+        "updated_at": workflow["updated_at"]
+    }
 
-@router.get("/", response_model=List[WorkflowList])
-async def list_workflows():
-    """List all workflows."""
+
+async def _stream_workflows(query: str, values: tuple):
+    """Yield workflow rows as NDJSON without materializing the table."""
     async with get_db() as db:
-        workflows = await db.fetch_all("SELECT * FROM workflows")
-        return [
-            {
-                "id": workflow["id"],
-                "name": workflow["name"],
-                "description": workflow["description"],
-                "status": workflow["status"],
-                "created_at": workflow["created_at"],
-                "updated_at": workflow["updated_at"]
-            }
-            for workflow in workflows
-        ]
+        async for row in db.iterate(query, values):
+            yield orjson.dumps(_workflow_summary(row)) + b"\n"
+
 
+@router.get("", include_in_schema=False)
+@router.get("/")
+async def list_workflows(
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    after_id: Optional[str] = None,
+    stream: bool = False
+):
+    """List all workflows.
 
-@router.get("/templates", response_model=List[Dict[str, Any]])
-async def list_workflow_templates():
+    Large tables can be paged with keyset pagination (`limit` plus the
+    `created_at` and `id` of the last row as `after`/`after_id`; both are
+    needed because timestamps are second-granular, and omitting
+    `after_id` skips any rows sharing the boundary second), or streamed
+    as NDJSON with `stream=true` so rows are emitted as they arrive
+    instead of being materialized in memory. Rows come straight from the
+    database and already match the WorkflowList shape, so they are
+    serialized directly instead of being revalidated through a response
+    model.
+    """
+    if after is not None:
+        query = _LIST_WORKFLOWS_PAGE_SQL
+        values = (after, after_id or "", limit if limit is not None else 50)
+    elif limit is not None:
+        query = _LIST_WORKFLOWS_LIMIT_SQL
+        values = (limit,)
+    else:
+        query = _LIST_WORKFLOWS_SQL
+        values = ()
+
+    if stream:
+        return StreamingResponse(
+            _stream_workflows(query, values),
+            media_type="application/x-ndjson"
+        )
+
+    async with get_db() as db:
+        workflows = await db.fetch_all(query, values)
+        return [_workflow_summary(workflow) for workflow in workflows]
+
+
+@router.get("/templates")
+async def list_workflow_templates(request: Request):
     """List all available workflow templates."""
-    # Return a list of predefined workflow templates
-    return [
-        {
-            "id": "data-analysis",
-            "name": "Data Analysis Workflow",
-            "description": "Analyze data sets and generate insights",
-            "steps": [
-                {"name": "Research", "agent": "Researcher",
-                    "description": "Gather relevant data"},
-                {"name": "Process", "agent": "Processor",
-                    "description": "Process and analyze data"},
-                {"name": "Approve", "agent": "Approver",
-                    "description": "Validate analysis results"},
-                {"name": "Optimize", "agent": "Optimizer",
-                    "description": "Suggest improvements"}
-            ]
-        },
-        {
-            "id": "content-generation",
-            "name": "Content Generation Workflow",
-            "description": "Generate and optimize content based on requirements",
-            "steps": [
-                {"name": "Research", "agent": "Researcher",
-                    "description": "Research topic and gather information"},
-                {"name": "Process", "agent": "Processor",
-                    "description": "Generate initial content draft"},
-                {"name": "Approve", "agent": "Approver",
-                    "description": "Review and approve content"},
-                {"name": "Optimize", "agent": "Optimizer",
-                    "description": "Optimize content for engagement"}
-            ]
-        },
-        {
-            "id": "customer-support",
-            "name": "Customer Support Workflow",
-            "description": "Handle customer inquiries and support tickets",
-            "steps": [
-                {"name": "Research", "agent": "Researcher",
-                    "description": "Research customer history and issue"},
-                {"name": "Process", "agent": "Processor",
-                    "description": "Generate response or solution"},
-                {"name": "Approve", "agent": "Approver",
-                    "description": "Review and approve response"},
-                {"name": "Optimize", "agent": "Optimizer",
-                    "description": "Suggest improvements to process"}
-            ]
+    # Short-circuit with 304 when the client already has the current payload
+    if request.headers.get("if-none-match") == _TEMPLATES_ETAG:
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": _TEMPLATES_ETAG,
+                "Cache-Control": _TEMPLATES_CACHE_CONTROL
+            }
+        )
+
+    return Response(
+        content=_TEMPLATES_JSON,
+        media_type="application/json",
+        headers={
+            "ETag": _TEMPLATES_ETAG,
+            "Cache-Control": _TEMPLATES_CACHE_CONTROL
         }
-    ]
+    )
+
+
+# Workflow IDs are random UUID4s, but uuid.uuid4() reads os.urandom per
+# call. Drawing the entropy for a whole batch in one read amortizes the
+# syscall across many creations.
+_UUID_BATCH_SIZE = 256
+_uuid_pool: deque = deque()
 
 
-@router.get("/{workflow_id}", response_model=WorkflowDetail)
-async def get_workflow(workflow_id: str):
-    """Get a specific workflow by ID."""
+def _next_workflow_id() -> str:
+    """Return a random workflow ID from the pre-generated batch."""
+    if not _uuid_pool:
+        entropy = os.urandom(16 * _UUID_BATCH_SIZE)
+        _uuid_pool.extend(
+            str(uuid.UUID(bytes=entropy[i:i + 16], version=4))
+            for i in range(0, len(entropy), 16)
+        )
+    return _uuid_pool.popleft()
+
+
+# Shared orchestrator, built on first use. Instantiating one constructs
+# four agents and compiles the LangGraph state graph, which is far too
+# expensive to repeat per request.
+_orchestrator: Optional[WorkflowOrchestrator] = None
+
+
+def _get_orchestrator() -> WorkflowOrchestrator:
+    """Return the process-wide orchestrator, creating it on first call."""
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = WorkflowOrchestrator(
+            use_mock=config.workflow.use_mock)
+    return _orchestrator
+
+
+def _sql_now() -> str:
+    """Current UTC time in SQLite's default TIMESTAMP text format.
+
+    Computed once in Python and bound as a parameter, so a multi-column
+    write calls no SQLite date function and every column in the same
+    statement gets an identical timestamp.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+
+async def _run_workflow(workflow_id: str,
+                        input_data: Dict[str, Any]) -> None:
+    """Execute a workflow in the background and persist its outcome.
+
+    Runs after the creation response has been sent, so slow agent/LLM
+    calls never tie up the HTTP request. The pending row is inserted by
+    the request handler before the response, so polling clients always
+    find the workflow; this task only moves it to a terminal state.
+    """
+    start_time = time.monotonic()
+    try:
+        orchestrator = _get_orchestrator()
+        # Share the execution semaphore with POST /execute so a burst of
+        # creates can't schedule unbounded concurrent orchestrations
+        async with _execution_semaphore():
+            result = await orchestrator.execute_workflow(
+                workflow_id, input_data)
+        execution_time = time.monotonic() - start_time
+
+        # Persist the outcome and the execution metrics in one transaction
+        await db.execute_transaction([
+            (
+                """
+                UPDATE workflows
+                SET status = ?, result = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (result["status"], orjson.dumps(
+                    result.get("result", {})), _sql_now(), workflow_id)
+            ),
+            (
+                """
+                INSERT INTO workflow_executions (workflow_id, execution_time, status)
+                VALUES (?, ?, ?)
+                """,
+                (workflow_id, execution_time, result["status"])
+            )
+        ])
+
+        # Drop any cached pre-completion read so pollers see the new
+        # status immediately instead of after the TTL expires
+        _cache_invalidate(workflow_id)
+
+    except Exception as e:
+        logger.error(f"Error executing workflow {workflow_id}: {str(e)}")
+        execution_time = time.monotonic() - start_time
+
+        # Update workflow status to error
+        await db.execute_transaction([
+            (
+                """
+                UPDATE workflows
+                SET status = ?, error = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                ("error", str(e), _sql_now(), workflow_id)
+            ),
+            (
+                """
+                INSERT INTO workflow_executions (workflow_id, execution_time, status)
+                VALUES (?, ?, ?)
+                """,
+                (workflow_id, execution_time, "error")
+            )
+        ])
+
+        _cache_invalidate(workflow_id)
+
+
+@router.post("", status_code=201, include_in_schema=False)
+@router.post("/", status_code=201,
+             responses={201: {"model": WorkflowResponse}})
+async def create_workflow(request: WorkflowCreate,
+                          background_tasks: BackgroundTasks):
+    """Create a workflow and schedule its execution in the background.
+
+    The response dict is built entirely from values this handler chose,
+    so it skips response-model validation and goes straight through
+    orjson; WorkflowResponse is kept in `responses` for the docs.
+    """
+    # Generate a unique ID for the workflow
+    workflow_id = _next_workflow_id()
+
+    # Log workflow creation
+    logger.info(f"Creating workflow {workflow_id}: {request.name}")
+
+    # The pending row must exist before the response goes out, or a
+    # client that POSTs and immediately polls would see a 404 for a
+    # workflow it just created
+    now = _sql_now()
+    await db.execute(
+        """
+        INSERT INTO workflows
+        (id, name, description, status, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (workflow_id, request.name, request.description, "pending", now, now)
+    )
+
+    # Execute the workflow after the response is sent
+    background_tasks.add_task(_run_workflow, workflow_id, request.input_data)
+
+    return {
+        "workflow_id": workflow_id,
+        "name": request.name,
+        "description": request.description,
+        "status": "pending",
+        "result": None,
+        "error": None,
+        "history": []
+    }
+
+
+@router.get("/{workflow_id}",
+            responses={200: {"model": WorkflowDetail}})
+async def get_workflow(workflow_id: str, include_result: bool = True):
+    """Get a specific workflow by ID.
+
+    Callers that only need id/status metadata can pass
+    `include_result=false` to skip decoding the stored result blob.
+    The row comes straight from our own database, so it is serialized
+    directly instead of being revalidated through WorkflowDetail; the
+    model remains in `responses` for the docs.
+    """
+    # Serve recently fetched workflows from the in-process cache
+    cached = _cache_get(workflow_id)
+    if cached is not None:
+        if not include_result:
+            return {**cached, "result": None}
+        return cached
+
     async with get_db() as db:
-        workflow = await db.fetch_one(
-            "SELECT * FROM workflows WHERE id = ?",
+        row = await db.fetch_one(
+            _GET_WORKFLOW_SQL,
             (workflow_id,)
         )
 
-        if not workflow:
+        if not row:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
-        # Parse the result JSON if it exists
+        workflow = dict(row)
+
+        # Parse the result JSON lazily: only when the caller wants it
         result = None
-        if workflow.get("result"):
+        if include_result and workflow.get("result"):
             try:
-                result = json.loads(workflow["result"])
-            except json.JSONDecodeError:
+                result = orjson.loads(workflow["result"])
+            except orjson.JSONDecodeError:
                 result = {"data": workflow["result"]}
 
-        return {
+        detail = {
             "id": workflow["id"],
             "name": workflow["name"],
             "description": workflow["description"],
@@ -110,25 +422,25 @@ async def get_workflow(workflow_id: str):
             "created_at": workflow["created_at"],
             "updated_at": workflow["updated_at"]
         }
+        # Only fully parsed details are cached, so metadata-only reads
+        # can't shadow a later request for the result
+        if include_result:
+            _cache_put(workflow_id, detail)
+        return detail
 
 
 @router.delete("/{workflow_id}", status_code=204)
 async def delete_workflow(workflow_id: str):
     """Delete a workflow by ID."""
     async with get_db() as db:
-        # Check if workflow exists
-        workflow = await db.fetch_one(
-            "SELECT id FROM workflows WHERE id = ?",
+        # Delete directly; a zero rowcount means the workflow never existed
+        deleted = await db.execute(
+            _DELETE_WORKFLOW_SQL,
             (workflow_id,)
         )
 
-        if not workflow:
+        if not deleted:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
-        # Delete the workflow
-        await db.execute(
-            "DELETE FROM workflows WHERE id = ?",
-            (workflow_id,)
-        )
-
+        _cache_invalidate(workflow_id)
         return None
@@ -5,6 +5,7 @@ This module handles loading configuration from environment variables,
 configuration files, and provides defaults for development environments.
 """
 
+import logging
 import os
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -25,6 +26,8 @@ class DatabaseConfig(BaseModel):
     url: str = Field(default="workflows.db")
     echo: bool = Field(default=False)
     connect_args: Dict[str, Any] = Field(default_factory=dict)
+    pool_min_size: int = Field(default=5)
+    pool_max_size: int = Field(default=25)
 
     model_config = {"extra": "allow"}
 
@@ -44,9 +47,15 @@ class CORSConfig(BaseModel):
     """CORS configuration settings."""
     allowed_origins: List[str] = Field(default=["*"])
     allow_credentials: bool = Field(default=True)
-    allow_methods: List[str] = Field(default=["*"])
-    allow_headers: List[str] = Field(default=["*"])
-    max_age: int = Field(default=600)  # 10 minutes in seconds
+    # Enumerate methods/headers instead of "*" so CORSMiddleware matches
+    # against a fixed set rather than expanding wildcards per request
+    allow_methods: List[str] = Field(
+        default=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
+    allow_headers: List[str] = Field(
+        default=["Authorization", "Content-Type", "X-Request-ID"])
+    # Chrome caps preflight caching at 2 hours; use the full allowance so
+    # browsers re-preflight as rarely as possible
+    max_age: int = Field(default=7200)
 
     model_config = {"extra": "allow"}
 
@@ -63,8 +72,12 @@ class RateLimitConfig(BaseModel):
 class WorkflowConfig(BaseModel):
     """Workflow execution configuration settings."""
     use_mock: bool = Field(default=True)
+    # Skip the stub agents entirely and return a canned state; for
+    # benchmarks and load tests where agent round-trips are noise
+    fast_mock: bool = Field(default=False)
     timeout_seconds: float = Field(default=30.0)
     max_retries: int = Field(default=3)
+    max_concurrent_executions: int = Field(default=32)
 
     model_config = {"extra": "allow"}
 
@@ -94,119 +107,88 @@ class AppConfig(BaseModel):
     model_config = {"extra": "allow"}
 
 
+# Mapping of environment variables to (section, field, parser) so all
+# overrides are gathered in a single pass instead of branch-by-branch
+# model_copy calls, each of which re-validates its sub-model.
+def _parse_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+ENV_VAR_MAP = {
+    "DATABASE_URL": ("database", "url", str),
+    "DATABASE_POOL_MIN_SIZE": ("database", "pool_min_size", int),
+    "DATABASE_POOL_MAX_SIZE": ("database", "pool_max_size", int),
+    "API_HOST": ("api", "host", str),
+    "API_PORT": ("api", "port", int),
+    "API_RELOAD": ("api", "reload", _parse_bool),
+    "API_WORKERS": ("api", "workers", int),
+    "API_DEBUG": ("api", "debug", _parse_bool),
+    "CORS_ALLOWED_ORIGINS": ("cors", "allowed_origins",
+                             lambda v: v.split(",")),
+    "RATE_LIMIT_ENABLED": ("rate_limit", "enabled", _parse_bool),
+    "RATE_LIMIT_PER_MINUTE": ("rate_limit", "per_minute", int),
+    "USE_MOCK_WORKFLOW": ("workflow", "use_mock", _parse_bool),
+    "USE_FAST_MOCK": ("workflow", "fast_mock", _parse_bool),
+    "LOG_LEVEL": ("logging", "level", str),
+    "LOG_FILE": ("logging", "file", str),
+}
+
+
 # Load config based on environment
 def load_config() -> AppConfig:
     """Load configuration based on the current environment."""
-    # Base configuration
-    config = AppConfig(environment=ENV)
-
-    # Create updated configs with environment variable values
-    db_updates = {}
-    api_updates = {}
-    cors_updates = {}
-    rate_limit_updates = {}
-    workflow_updates = {}
-    logging_updates = {}
-    app_updates = {}
-
-    # Override with environment variables
-    if os.getenv("DATABASE_URL"):
-        db_updates["url"] = os.getenv("DATABASE_URL")
-
-    if os.getenv("API_HOST"):
-        api_updates["host"] = os.getenv("API_HOST")
-
-    if os.getenv("API_PORT"):
-        api_updates["port"] = int(os.getenv("API_PORT"))
-
-    if os.getenv("API_RELOAD"):
-        api_updates["reload"] = os.getenv("API_RELOAD").lower() == "true"
-
-    if os.getenv("API_DEBUG"):
-        api_updates["debug"] = os.getenv("API_DEBUG").lower() == "true"
-
-    # CORS configuration
-    if os.getenv("CORS_ALLOWED_ORIGINS"):
-        cors_updates["allowed_origins"] = os.getenv(
-            "CORS_ALLOWED_ORIGINS").split(",")
-
-    # Rate limiting configuration
-    if os.getenv("RATE_LIMIT_ENABLED"):
-        rate_limit_updates["enabled"] = os.getenv(
-            "RATE_LIMIT_ENABLED").lower() == "true"
-
-    if os.getenv("RATE_LIMIT_PER_MINUTE"):
-        rate_limit_updates["per_minute"] = int(
-            os.getenv("RATE_LIMIT_PER_MINUTE"))
-
-    if os.getenv("USE_MOCK_WORKFLOW"):
-        workflow_updates["use_mock"] = os.getenv(
-            "USE_MOCK_WORKFLOW").lower() == "true"
+    # Collect every override into one nested dict, then validate once
+    overrides: Dict[str, Any] = {"environment": ENV}
 
-    if os.getenv("LOG_LEVEL"):
-        logging_updates["level"] = os.getenv("LOG_LEVEL")
-
-    if os.getenv("LOG_FILE"):
-        logging_updates["file"] = os.getenv("LOG_FILE")
+    for env_var, (section, field, parse) in ENV_VAR_MAP.items():
+        value = os.getenv(env_var)
+        if value:
+            overrides.setdefault(section, {})[field] = parse(value)
 
     if os.getenv("SECRET_KEY"):
-        app_updates["secret_key"] = os.getenv("SECRET_KEY")
-
-    # Apply updates using model_copy
-    if db_updates:
-        config.database = config.database.model_copy(update=db_updates)
-
-    if api_updates:
-        config.api = config.api.model_copy(update=api_updates)
-
-    if cors_updates:
-        config.cors = config.cors.model_copy(update=cors_updates)
-
-    if rate_limit_updates:
-        config.rate_limit = config.rate_limit.model_copy(
-            update=rate_limit_updates)
-
-    if workflow_updates:
-        config.workflow = config.workflow.model_copy(update=workflow_updates)
-
-    if logging_updates:
-        config.logging = config.logging.model_copy(update=logging_updates)
+        overrides["secret_key"] = os.getenv("SECRET_KEY")
 
     # Production-specific overrides
     if ENV == "production":
-        app_updates["debug"] = False
-        api_updates["debug"] = False
-        api_updates["reload"] = False
+        overrides["debug"] = False
+        overrides.setdefault("api", {}).update(debug=False, reload=False)
 
         # Production CORS settings if not explicitly set
         if not os.getenv("CORS_ALLOWED_ORIGINS"):
-            cors_updates["allowed_origins"] = [
-                "https://workflowforge.com",
-                "https://app.workflowforge.com",
-                "https://api.workflowforge.com"
-            ]
-            cors_updates["allow_methods"] = [
-                "GET", "POST", "PUT", "DELETE", "OPTIONS"]
-            cors_updates["allow_headers"] = ["Authorization", "Content-Type"]
-            cors_updates["max_age"] = 86400  # 24 hours in seconds
+            overrides["cors"] = {
+                "allowed_origins": [
+                    "https://workflowforge.com",
+                    "https://app.workflowforge.com",
+                    "https://api.workflowforge.com"
+                ],
+                "allow_methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+                "allow_headers": ["Authorization", "Content-Type"],
+                "max_age": 86400  # 24 hours in seconds
+            }
 
         # Enable rate limiting in production by default
         if not os.getenv("RATE_LIMIT_ENABLED"):
-            rate_limit_updates["enabled"] = True
-
-        # Apply production updates
-        config = config.model_copy(update=app_updates)
-        config.api = config.api.model_copy(update=api_updates)
-        config.cors = config.cors.model_copy(update=cors_updates)
-        config.rate_limit = config.rate_limit.model_copy(
-            update=rate_limit_updates)
+            overrides.setdefault("rate_limit", {})["enabled"] = True
 
         if not os.getenv("SECRET_KEY"):
             raise ValueError(
                 "SECRET_KEY must be set in production environment")
 
-    return config
+    return AppConfig.model_validate(overrides)
 
 
 # Create global config instance
 config = load_config()
+
+
+def configure_logging() -> None:
+    """Configure the root logger from the loaded configuration.
+
+    Called once by each entry point (API startup, demo script) instead
+    of at import time, so importing application modules never mutates
+    the root logger as a side effect.
+    """
+    logging.basicConfig(
+        level=getattr(logging, config.logging.level),
+        format=config.logging.format
+    )
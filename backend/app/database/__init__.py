@@ -2,10 +2,85 @@
 
 import aiosqlite
 import os
+from collections import deque
 from typing import Optional, AsyncGenerator, Any
 from contextlib import asynccontextmanager
 
-DATABASE_URL = "workflows.db"
+from app.config import config
+
+DATABASE_URL = config.database.url
+
+# Pool sizing: keep a few warm connections around and cap how many idle
+# connections we retain so bursts don't leave threads behind forever.
+POOL_MIN_SIZE = config.database.pool_min_size
+POOL_MAX_SIZE = config.database.pool_max_size
+
+# SQLite compiles each distinct SQL string into a prepared statement and
+# caches it per connection; size the cache to cover every statement the
+# API issues so repeat requests skip the parse/plan step entirely.
+STATEMENT_CACHE_SIZE = 256
+
+
+class ConnectionPool:
+    """Pool of persistent aiosqlite connections.
+
+    Opening a SQLite connection spawns a worker thread and re-parses the
+    schema on every request; keeping connections alive across requests
+    removes that per-request setup cost. Connections are handed out via
+    :meth:`acquire` and returned to the idle set on release.
+    """
+
+    def __init__(self, database: str, min_size: int = POOL_MIN_SIZE,
+                 max_size: int = POOL_MAX_SIZE):
+        self.database = database
+        self.min_size = min_size
+        self.max_size = max_size
+        self._idle: deque = deque()
+        self._closed = False
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open and configure a new pooled connection."""
+        conn = await aiosqlite.connect(
+            self.database, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = aiosqlite.Row
+        # WAL lets readers proceed while a writer commits, and
+        # synchronous=NORMAL skips the per-commit fsync that dominates
+        # small-write latency (WAL still guarantees crash consistency,
+        # at worst losing the final commit on power failure)
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        await conn.execute("PRAGMA temp_store=MEMORY")
+        await conn.execute("PRAGMA cache_size=-16384")
+        return conn
+
+    async def open(self) -> None:
+        """Warm the pool up to its minimum size."""
+        self._closed = False
+        while len(self._idle) < self.min_size:
+            self._idle.append(await self._connect())
+
+    async def close(self) -> None:
+        """Close all idle connections and stop handing out new ones."""
+        self._closed = True
+        while self._idle:
+            conn = self._idle.popleft()
+            await conn.close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Acquire a connection from the pool as an async context manager."""
+        conn = self._idle.popleft() if self._idle else await self._connect()
+        try:
+            yield conn
+        finally:
+            if not self._closed and len(self._idle) < self.max_size:
+                self._idle.append(conn)
+            else:
+                await conn.close()
+
+
+# Shared pool used by all Database operations
+pool = ConnectionPool(DATABASE_URL)
 
 
 class Database:
@@ -13,35 +88,75 @@ class Database:
 
     async def fetch_all(self, query: str, values: tuple = None) -> list:
         """Execute a query and return all results."""
-        async with aiosqlite.connect(DATABASE_URL) as db:
-            db.row_factory = aiosqlite.Row
+        async with pool.acquire() as db:
             async with db.execute(query, values or ()) as cursor:
                 return await cursor.fetchall()
 
     async def fetch_one(self, query: str, values: tuple = None) -> Optional[dict]:
         """Execute a query and return one result."""
-        async with aiosqlite.connect(DATABASE_URL) as db:
-            db.row_factory = aiosqlite.Row
+        async with pool.acquire() as db:
             async with db.execute(query, values or ()) as cursor:
                 return await cursor.fetchone()
 
     async def fetch_val(self, query: str, values: tuple = None) -> Optional[Any]:
         """Execute a query and return a single value."""
-        async with aiosqlite.connect(DATABASE_URL) as db:
+        async with pool.acquire() as db:
             async with db.execute(query, values or ()) as cursor:
                 result = await cursor.fetchone()
                 return result[0] if result else None
 
-    async def execute(self, query: str, values: tuple = None) -> None:
-        """Execute a query without returning results."""
-        async with aiosqlite.connect(DATABASE_URL) as db:
-            await db.execute(query, values or ())
+    async def iterate(self, query: str, values: tuple = None,
+                      batch_size: int = 100) -> AsyncGenerator[Any, None]:
+        """Execute a query and yield rows in batches without materializing
+        the full result set in memory."""
+        async with pool.acquire() as db:
+            async with db.execute(query, values or ()) as cursor:
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row
+
+    async def execute(self, query: str, values: tuple = None) -> int:
+        """Execute a query and return the number of affected rows."""
+        async with pool.acquire() as db:
+            cursor = await db.execute(query, values or ())
+            await db.commit()
+            return cursor.rowcount
+
+    async def execute_many(self, query: str, values_list: list) -> int:
+        """Execute one query for many value tuples in a single commit.
+
+        Bulk inserts (e.g. a batch of execution records) go through
+        sqlite's executemany, which reuses one prepared statement and
+        one commit for the whole batch instead of a thread handoff and
+        fsync per row.
+        """
+        async with pool.acquire() as db:
+            cursor = await db.executemany(query, values_list)
+            await db.commit()
+            return cursor.rowcount
+
+    async def execute_transaction(self, statements: list) -> None:
+        """Execute multiple (query, values) statements in one transaction.
+
+        All statements share a single connection and commit, so related
+        writes cost one round-trip to disk instead of one per statement.
+        """
+        async with pool.acquire() as db:
+            for query, values in statements:
+                await db.execute(query, values or ())
             await db.commit()
 
 
 async def init_db():
     """Initialize the database with required tables."""
     async with aiosqlite.connect(DATABASE_URL) as db:
+        # WAL is persistent: setting it once here switches the database
+        # file over for every later connection
+        await db.execute("PRAGMA journal_mode=WAL")
+
         # Create workflows table
         await db.execute("""
             CREATE TABLE IF NOT EXISTS workflows (
@@ -50,11 +165,19 @@ async def init_db():
                 description TEXT,
                 status TEXT NOT NULL,
                 result TEXT,
+                error TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
 
+        # Databases created before the error column existed need it added
+        # in place; CREATE TABLE IF NOT EXISTS won't touch them
+        async with db.execute("PRAGMA table_info(workflows)") as cursor:
+            columns = [row[1] for row in await cursor.fetchall()]
+        if "error" not in columns:
+            await db.execute("ALTER TABLE workflows ADD COLUMN error TEXT")
+
         # Create workflow_executions table
         await db.execute("""
             CREATE TABLE IF NOT EXISTS workflow_executions (
@@ -67,6 +190,17 @@ async def init_db():
             )
         """)
 
+        # Index the columns hit by the metrics endpoint so the status
+        # counts and the recent-workflows query avoid full table scans
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_workflows_status
+            ON workflows(status)
+        """)
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_workflows_created_at
+            ON workflows(created_at DESC)
+        """)
+
         await db.commit()
 
 
@@ -77,7 +211,7 @@ async def get_db() -> AsyncGenerator[Database, None]:
     try:
         yield db
     finally:
-        # No explicit cleanup needed as each operation manages its own connection
+        # Connections are managed by the shared pool, not per instance
         pass
 
 # Create a global database instance
@@ -1,50 +1,69 @@
+import asyncio
 import logging
-import uuid
 import os
+import sys
+import orjson
 import psutil
-import json
 import time
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
 from datetime import datetime
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
 
 # First import config to avoid circular imports
-from app.config import config
+from app.config import config, configure_logging
+
+# Configure logging before the modules below create their loggers
+configure_logging()
+logger = logging.getLogger(__name__)
 
 # Then import other modules that might depend on config
-from app.database import init_db, get_db, db
-from app.workflow.orchestrator import WorkflowOrchestrator
+from app.database import init_db, pool
 from app.api import workflows, agents, execute, metrics
 from app.auth import api as auth_api
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, config.logging.level),
-    format=config.logging.format
-)
-logger = logging.getLogger(__name__)
-
 # Import API routers
 
+# CPU usage is read with psutil.cpu_percent(interval=None) in the metrics
+# handlers, which returns instantly using the delta since the previous
+# reading. This background task keeps that delta window short so request-
+# time readings stay meaningful even between scrapes.
+_CPU_SAMPLE_SECONDS = 5.0
+
+
+async def _sample_cpu_percent():
+    """Periodically refresh psutil's CPU usage delta window."""
+    while True:
+        await asyncio.sleep(_CPU_SAMPLE_SECONDS)
+        psutil.cpu_percent(interval=None)
+
+
 # Lifespan context manager for startup/shutdown events
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events for the application."""
-    # Log startup information
+    # Log startup information, including the interpreter actually running
+    # in the container so version/allocator changes are visible in logs
     logger.info(
-        f"Starting WorkflowForge API in {config.environment} environment")
+        f"Starting WorkflowForge API in {config.environment} environment "
+        f"on Python {sys.version.split()[0]}")
 
     # Initialize the database
     logger.info("Initializing database...")
     await init_db()
 
+    # Warm the connection pool so the first requests don't pay setup cost
+    await pool.open()
+
+    # Prime the CPU counter and keep it fresh in the background
+    psutil.cpu_percent(interval=None)
+    cpu_sampler = asyncio.create_task(_sample_cpu_percent())
+
     # Create healthcheck file to indicate the API is running
     healthcheck_file = os.path.join(
         os.path.dirname(__file__), '..', '.healthcheck')
@@ -56,6 +75,12 @@ async def lifespan(app: FastAPI):
     # Cleanup on shutdown
     logger.info("Shutting down WorkflowForge API")
 
+    # Stop the CPU sampler
+    cpu_sampler.cancel()
+
+    # Release pooled database connections
+    await pool.close()
+
     # Remove healthcheck file
     if os.path.exists(healthcheck_file):
         os.remove(healthcheck_file)
@@ -67,10 +92,107 @@ app = FastAPI(
     description="Multi-agent workflow orchestration system",
     version="0.1.0",
     lifespan=lifespan,
-    debug=config.api.debug
+    debug=config.api.debug,
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware with configuration from config
+# Rate limiting middleware
+class RateLimitMiddleware:
+    """Per-IP token-bucket rate limiter, implemented as pure ASGI.
+
+    Each client gets a bucket of two floats (remaining tokens, last
+    refill time) that refills continuously at the configured rate, so
+    the check per request is O(1) instead of scanning every known
+    IP's timestamp list. The bucket map is bounded with LRU eviction
+    so a flood of distinct IPs can't grow it without limit.
+
+    Working directly on the ASGI scope avoids building a Request and
+    Response object for every hit; add_middleware calls middlewares
+    with (scope, receive, send), so this is also the signature
+    Starlette actually expects.
+    """
+
+    # Cap on tracked client IPs before the least recently seen is evicted
+    MAX_TRACKED_CLIENTS = 100_000
+
+    # Serialized once; every rejected request sends the same body
+    _REJECT_BODY = orjson.dumps(
+        {"detail": "Rate limit exceeded. Please try again later."})
+    _REJECT_HEADERS = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_REJECT_BODY)).encode()),
+    ]
+
+    def __init__(
+        self,
+        app,
+        calls_per_minute: int = 60,
+        window_size: int = 60
+    ):
+        self.app = app
+        self.calls_per_minute = calls_per_minute
+        self.window_size = window_size  # Window size in seconds
+        self.buckets: OrderedDict = OrderedDict()
+        logger.info(
+            f"Rate limiting enabled: {calls_per_minute} requests per minute")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+
+        if self._is_rate_limited(client_ip, time.time()):
+            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": self._REJECT_HEADERS,
+            })
+            await send({
+                "type": "http.response.body",
+                "body": self._REJECT_BODY,
+            })
+            return
+
+        await self.app(scope, receive, send)
+
+    def _is_rate_limited(self, client_ip: str, current_time: float) -> bool:
+        """Take a token from the client's bucket, refilling it first."""
+        rate = self.calls_per_minute
+        tokens, last_refill = self.buckets.get(
+            client_ip, (float(rate), current_time))
+
+        # Refill proportionally to the time elapsed since the last hit
+        elapsed = current_time - last_refill
+        tokens = min(float(rate), tokens + elapsed * rate / self.window_size)
+
+        limited = tokens < 1.0
+        if not limited:
+            tokens -= 1.0
+
+        self.buckets[client_ip] = (tokens, current_time)
+        self.buckets.move_to_end(client_ip)
+        if len(self.buckets) > self.MAX_TRACKED_CLIENTS:
+            self.buckets.popitem(last=False)
+
+        return limited
+
+
+# Register the limiter only when enabled; the class stays importable
+# either way so it can be unit-tested
+if config.rate_limit.enabled:
+    app.add_middleware(
+        RateLimitMiddleware,
+        calls_per_minute=config.rate_limit.per_minute,
+        window_size=config.rate_limit.window_size
+    )
+
+# Add CORS last so it is the outermost middleware: preflight OPTIONS
+# requests are answered directly from its precomputed headers without
+# traversing the rate limiter or the routing stack
 app.add_middleware(
     CORSMiddleware,
     allow_origins=config.cors.allowed_origins,
@@ -84,89 +206,6 @@ app.add_middleware(
 logger.info(
     f"CORS configuration: allowed origins = {config.cors.allowed_origins}")
 
-# Rate limiting middleware
-if config.rate_limit.enabled:
-    class RateLimitMiddleware:
-        def __init__(
-            self,
-            app,
-            calls_per_minute: int = 60,
-            window_size: int = 60
-        ):
-            self.app = app
-            self.calls_per_minute = calls_per_minute
-            self.window_size = window_size  # Window size in seconds
-            self.request_counts = {}
-            logger.info(
-                f"Rate limiting enabled: {calls_per_minute} requests per minute")
-
-        async def __call__(self, request: Request, call_next):
-            # Get client IP
-            client_ip = request.client.host
-            current_time = time.time()
-
-            # Clean up old entries
-            self._cleanup_old_requests(current_time)
-
-            # Check if rate limit exceeded
-            if self._is_rate_limited(client_ip, current_time):
-                logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "detail": "Rate limit exceeded. Please try again later."}
-                )
-
-            # Process the request
-            return await call_next(request)
-
-        def _cleanup_old_requests(self, current_time: float):
-            """Remove requests older than the window size."""
-            cutoff_time = current_time - self.window_size
-            for ip in list(self.request_counts.keys()):
-                self.request_counts[ip] = [
-                    timestamp for timestamp in self.request_counts[ip]
-                    if timestamp > cutoff_time
-                ]
-                if not self.request_counts[ip]:
-                    del self.request_counts[ip]
-
-        def _is_rate_limited(self, client_ip: str, current_time: float) -> bool:
-            """Check if the client IP has exceeded the rate limit."""
-            if client_ip not in self.request_counts:
-                self.request_counts[client_ip] = []
-
-            self.request_counts[client_ip].append(current_time)
-
-            # Check if rate limit exceeded
-            return len(self.request_counts[client_ip]) > self.calls_per_minute
-
-    # Add rate limiting middleware
-    app.add_middleware(
-        RateLimitMiddleware,
-        calls_per_minute=config.rate_limit.per_minute,
-        window_size=config.rate_limit.window_size
-    )
-
-
-# Define request and response models
-class WorkflowRequest(BaseModel):
-    """Request model for workflow execution."""
-    name: str
-    description: str
-    input_data: Dict[str, Any]
-
-
-class WorkflowResponse(BaseModel):
-    """Response model for workflow execution."""
-    workflow_id: str
-    name: str
-    description: str
-    status: str
-    result: Optional[Dict[str, Any]]
-    error: Optional[str]
-    history: List[Dict[str, Any]]
-
 
 # Include routers
 app.include_router(workflows.router, prefix="/workflows", tags=["workflows"])
@@ -188,142 +227,6 @@ async def root():
     }
 
 
-@app.get("/workflows")
-async def list_workflows():
-    """List all available workflows."""
-    async with get_db() as db:
-        workflows = await db.fetch_all("SELECT * FROM workflows")
-        return workflows
-
-
-@app.post("/workflows", response_model=WorkflowResponse, status_code=201)
-async def create_workflow(request: WorkflowRequest):
-    """Create and execute a new workflow."""
-    # Generate a unique ID for the workflow
-    workflow_id = str(uuid.uuid4())
-
-    # Log workflow creation
-    logger.info(f"Creating workflow {workflow_id}: {request.name}")
-
-    try:
-        # Store workflow in database
-        await db.execute(
-            """
-            INSERT INTO workflows 
-            (id, name, description, status, created_at, updated_at) 
-            VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            (workflow_id, request.name, request.description, "pending")
-        )
-
-        # Execute the workflow
-        orchestrator = WorkflowOrchestrator(use_mock=config.workflow.use_mock)
-        result = await orchestrator.execute_workflow(workflow_id, request.input_data)
-
-        # Update workflow status in database
-        await db.execute(
-            """
-            UPDATE workflows 
-            SET status = ?, result = ?, updated_at = datetime('now')
-            WHERE id = ?
-            """,
-            (result["status"], json.dumps(
-                result.get("result", {})), workflow_id)
-        )
-
-        # Return the workflow response
-        return {
-            "workflow_id": workflow_id,
-            "name": request.name,
-            "description": request.description,
-            "status": result["status"],
-            "result": result.get("result"),
-            "error": result.get("error"),
-            "history": result.get("history", [])
-        }
-
-    except Exception as e:
-        logger.error(f"Error creating workflow: {str(e)}")
-
-        # Update workflow status to error
-        await db.execute(
-            """
-            UPDATE workflows 
-            SET status = ?, error = ?, updated_at = datetime('now')
-            WHERE id = ?
-            """,
-            ("error", str(e), workflow_id)
-        )
-
-        # Return error response
-        return {
-            "workflow_id": workflow_id,
-            "name": request.name,
-            "description": request.description,
-            "status": "error",
-            "result": None,
-            "error": str(e),
-            "history": []
-        }
-
-
-@app.get("/workflows/{workflow_id}", response_model=WorkflowResponse)
-async def get_workflow(workflow_id: str):
-    """Get a specific workflow by ID."""
-    workflow = await db.fetch_one(
-        "SELECT * FROM workflows WHERE id = ?",
-        (workflow_id,)
-    )
-
-    if not workflow:
-        raise HTTPException(status_code=404, detail="Workflow not found")
-
-    # Parse the result JSON if it exists
-    result = None
-    if workflow.get("result"):
-        try:
-            result = json.loads(workflow["result"])
-        except json.JSONDecodeError:
-            result = {"data": workflow["result"]}
-
-    return {
-        "workflow_id": workflow["id"],
-        "name": workflow["name"],
-        "description": workflow["description"],
-        "status": workflow["status"],
-        "result": result,
-        "error": workflow.get("error"),
-        "history": []  # We don't store history in the database yet
-    }
-
-
-@app.get("/metrics")
-async def get_metrics():
-    """Get overall system metrics."""
-    # Get workflow execution metrics
-    total_executions = await db.fetch_val(
-        "SELECT COUNT(*) FROM workflow_executions"
-    ) or 0
-
-    # Get average execution time
-    avg_execution_time = await db.fetch_val(
-        "SELECT AVG(execution_time) FROM workflow_executions"
-    ) or 0
-
-    # Get system metrics
-    memory = psutil.virtual_memory()
-
-    return {
-        "total_executions": total_executions,
-        "avg_execution_time": round(float(avg_execution_time), 2),
-        "system_stats": {
-            "memory_usage": memory.percent,
-            "cpu_usage": psutil.cpu_percent(interval=0.1),
-            "timestamp": datetime.now().isoformat()
-        }
-    }
-
-
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring."""
@@ -336,12 +239,22 @@ async def health_check():
 
 # Add this section to run the app with uvicorn if the file is executed directly
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
+
+    # Prefer the C event loop and HTTP parser when they are installed;
+    # uvicorn falls back to asyncio/h11 otherwise
+    loop_impl = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+    http_impl = "httptools" if importlib.util.find_spec(
+        "httptools") else "auto"
+
     logger.info(f"Starting server on {config.api.host}:{config.api.port}")
     uvicorn.run(
         "app.main:app",
         host=config.api.host,
         port=config.api.port,
         reload=config.api.reload,
-        workers=config.api.workers
+        workers=config.api.workers,
+        loop=loop_impl,
+        http=http_impl
     )
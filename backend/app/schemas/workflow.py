@@ -89,7 +89,7 @@ class WorkflowResponse(BaseModel):
     status: str
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    history: List[Dict[str, Any]] = []
+    history: List[Dict[str, Any]] = Field(default_factory=list)
 
 
 class WorkflowDetail(BaseModel):
@@ -7,20 +7,16 @@ including workflow execution and self-reflection capabilities.
 """
 
 import asyncio
-import json
+import importlib.util
+import orjson
 import uuid
 import logging
 from datetime import datetime
 
 from app.workflow.orchestrator import WorkflowOrchestrator
-from app.database import init_db, get_db
-from app.config import config
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, config.logging.level),
-    format=config.logging.format
-)
+from app.database import init_db, get_db, pool
+from app.config import config, configure_logging
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,7 +58,7 @@ async def run_demo():
     }
 
     print("Input data:")
-    print(json.dumps(input_data, indent=2))
+    print(orjson.dumps(input_data, option=orjson.OPT_INDENT_2).decode())
     print()
 
     # Execute workflow
@@ -75,38 +71,39 @@ async def run_demo():
 
     # Print the raw result for debugging
     print("Raw workflow result:")
-    print(json.dumps(result, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
     print()
 
-    # Store workflow in database
+    # Store the workflow and its execution metrics in one transaction,
+    # so both inserts share a single connection round-trip and commit
     print("Storing workflow results...")
     async with get_db() as db:
-        await db.execute(
-            """
-            INSERT INTO workflows (id, name, description, status, result)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+        await db.execute_transaction([
             (
-                workflow_id,
-                workflow_name,
-                workflow_description,
-                result.get("status", "unknown"),
-                json.dumps(result.get("result", {}))
-            )
-        )
-
-        # Store execution metrics
-        await db.execute(
-            """
-            INSERT INTO workflow_executions (workflow_id, execution_time, status)
-            VALUES (?, ?, ?)
-            """,
+                """
+                INSERT INTO workflows (id, name, description, status, result)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    workflow_id,
+                    workflow_name,
+                    workflow_description,
+                    result.get("status", "unknown"),
+                    orjson.dumps(result.get("result", {}))
+                )
+            ),
             (
-                workflow_id,
-                execution_time,
-                result.get("status", "unknown")
+                """
+                INSERT INTO workflow_executions (workflow_id, execution_time, status)
+                VALUES (?, ?, ?)
+                """,
+                (
+                    workflow_id,
+                    execution_time,
+                    result.get("status", "unknown")
+                )
             )
-        )
+        ])
     print("Workflow results stored in database.\n")
 
     # Display results
@@ -116,7 +113,7 @@ async def run_demo():
     print("\nResult Data:")
     result_data = result.get("result", {})
     if result_data:
-        print(json.dumps(result_data, indent=2))
+        print(orjson.dumps(result_data, option=orjson.OPT_INDENT_2).decode())
     else:
         print("No result data available")
 
@@ -149,7 +146,7 @@ async def run_demo():
     try:
         optimization_result = await optimizer.process(optimization_input)
         print("\nOptimization Suggestions:")
-        print(json.dumps(optimization_result, indent=2))
+        print(orjson.dumps(optimization_result, option=orjson.OPT_INDENT_2).decode())
     except Exception as e:
         logger.error(f"Error during optimization: {str(e)}")
         print(f"\nOptimization failed: {str(e)}")
@@ -159,6 +156,17 @@ async def run_demo():
     print("Demonstration complete!")
     print("=" * 80 + "\n")
 
+    # Close pooled connections so their worker threads don't keep the
+    # process alive after the event loop exits
+    await pool.close()
+
 
 if __name__ == "__main__":
+    # Run on uvloop when it is installed, matching the server's event
+    # loop; plain asyncio otherwise
+    if importlib.util.find_spec("uvloop"):
+        import uvloop
+        uvloop.install()
+
+    configure_logging()
     asyncio.run(run_demo())
@@ -1,10 +1,22 @@
+import importlib.util
+
 import uvicorn
-from app.main import app
+
+from app.config import config
 
 if __name__ == "__main__":
+    # Prefer the C event loop and HTTP parser when they are installed;
+    # uvicorn falls back to asyncio/h11 otherwise
+    loop_impl = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+    http_impl = "httptools" if importlib.util.find_spec(
+        "httptools") else "auto"
+
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
+        host=config.api.host,
+        port=config.api.port,
+        reload=config.api.reload,
+        workers=config.api.workers,
+        loop=loop_impl,
+        http=http_impl
     )
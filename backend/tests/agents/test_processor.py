@@ -1,9 +1,7 @@
-import pytest
 from app.agents.processor import ProcessorAgent
 
 
-@pytest.mark.asyncio
-async def test_processor_agent_initialization():
+def test_processor_agent_initialization():
     """Test that the processor agent initializes correctly with the right properties."""
     agent = ProcessorAgent()
 
@@ -14,7 +12,6 @@ async def test_processor_agent_initialization():
     assert isinstance(agent.processing_history, list)
 
 
-@pytest.mark.asyncio
 async def test_processor_agent_process():
     """Test that the processor agent can process input data."""
     agent = ProcessorAgent()
@@ -42,8 +39,7 @@ async def test_processor_agent_process():
     assert agent.processing_history[0] == input_data
 
 
-@pytest.mark.asyncio
-async def test_processor_agent_config():
+def test_processor_agent_config():
     """Test that the processor agent returns the correct configuration."""
     agent = ProcessorAgent()
 
@@ -1,9 +1,7 @@
-import pytest
 from app.agents.researcher import ResearcherAgent
 
 
-@pytest.mark.asyncio
-async def test_researcher_agent_initialization():
+def test_researcher_agent_initialization():
     """Test that the researcher agent initializes correctly with the right properties."""
     agent = ResearcherAgent()
 
@@ -14,7 +12,6 @@ async def test_researcher_agent_initialization():
     assert isinstance(agent.research_history, list)
 
 
-@pytest.mark.asyncio
 async def test_researcher_agent_process():
     """Test that the researcher agent can process input data."""
     agent = ResearcherAgent()
@@ -42,7 +39,6 @@ async def test_researcher_agent_process():
     assert agent.research_history[0] == input_data
 
 
-@pytest.mark.asyncio
 async def test_researcher_agent_reset():
     """Test that the researcher agent can be reset."""
     agent = ResearcherAgent()
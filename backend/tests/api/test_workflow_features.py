@@ -0,0 +1,155 @@
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, AsyncMock
+from contextlib import asynccontextmanager
+import asyncio
+
+from app.main import app, RateLimitMiddleware
+from app.database import init_db
+import app.api.workflows as workflows_api
+
+
+@pytest.fixture(scope="session", autouse=True)
+def initialize_db():
+    """Initialize the database before running tests."""
+    asyncio.run(init_db())
+
+
+@pytest.fixture(autouse=True)
+def clear_workflow_cache():
+    """Keep the in-process workflow cache from leaking across tests."""
+    workflows_api._workflow_cache.clear()
+    yield
+    workflows_api._workflow_cache.clear()
+
+
+client = TestClient(app)
+
+SAMPLE_ROWS = [
+    {"id": "wf-1", "name": "First", "description": "first workflow",
+        "status": "completed", "created_at": "2023-01-02 00:00:00",
+        "updated_at": "2023-01-02 00:00:00"},
+    {"id": "wf-2", "name": "Second", "description": "second workflow",
+        "status": "pending", "created_at": "2023-01-01 00:00:00",
+        "updated_at": "2023-01-01 00:00:00"},
+]
+
+
+def _mock_db(captured):
+    """Build a get_db replacement that records each query and its values."""
+    class MockDB:
+        async def fetch_all(self, query, values=None):
+            captured.append((query, values))
+            return SAMPLE_ROWS
+
+        async def iterate(self, query, values=None, batch_size=100):
+            captured.append((query, values))
+            for row in SAMPLE_ROWS:
+                yield row
+
+    @asynccontextmanager
+    async def mock_get_db():
+        yield MockDB()
+
+    return mock_get_db
+
+
+def test_list_workflows_keyset_pagination():
+    """limit/after should page with the keyset query, not LIMIT/OFFSET."""
+    captured = []
+    with patch("app.api.workflows.get_db", return_value=_mock_db(captured)()):
+        response = client.get(
+            "/workflows?limit=2&after=2023-01-03%2000:00:00&after_id=wf-3")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+    query, values = captured[0]
+    # Composite key so rows sharing the boundary second aren't skipped
+    assert "(created_at, id) < (?, ?)" in query
+    assert "OFFSET" not in query.upper()
+    assert values == ("2023-01-03 00:00:00", "wf-3", 2)
+
+
+def test_list_workflows_streaming_ndjson():
+    """stream=true should emit one JSON document per row."""
+    captured = []
+    with patch("app.api.workflows.get_db", return_value=_mock_db(captured)()):
+        response = client.get("/workflows?stream=true")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(
+        "application/x-ndjson")
+
+    lines = [line for line in response.text.splitlines() if line]
+    assert len(lines) == len(SAMPLE_ROWS)
+
+
+def test_workflow_templates_etag_304():
+    """A matching If-None-Match should short-circuit with 304."""
+    first = client.get("/workflows/templates")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert "max-age" in first.headers["cache-control"]
+
+    second = client.get("/workflows/templates",
+                        headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+
+def test_create_workflow_visible_and_completes():
+    """A created workflow must be readable immediately and reach a
+    terminal state once the background run finishes."""
+    mock_orchestrator = AsyncMock()
+    mock_orchestrator.execute_workflow = AsyncMock(
+        return_value={"status": "completed",
+                      "result": {"key": "value"}, "history": []})
+
+    with patch.object(workflows_api, "_orchestrator", mock_orchestrator):
+        response = client.post("/workflows", json={
+            "name": "Background Test",
+            "description": "runs in the background",
+            "input_data": {"query": "test"}
+        })
+
+    assert response.status_code == 201
+    workflow_id = response.json()["workflow_id"]
+    assert response.json()["status"] == "pending"
+
+    # The TestClient runs background tasks before returning, so the
+    # terminal state (and the cache invalidation) has already happened
+    detail = client.get(f"/workflows/{workflow_id}")
+    assert detail.status_code == 200
+    assert detail.json()["status"] == "completed"
+    assert detail.json()["result"] == {"key": "value"}
+
+
+def test_get_workflow_cache_invalidation():
+    """Cached reads must not outlive an invalidation."""
+    workflows_api._cache_put("wf-cached", {"id": "wf-cached",
+                                           "status": "pending"})
+    assert workflows_api._cache_get("wf-cached") is not None
+
+    workflows_api._cache_invalidate("wf-cached")
+    assert workflows_api._cache_get("wf-cached") is None
+
+
+def test_rate_limiter_token_bucket():
+    """The bucket should drain, refill with time, and evict via LRU."""
+    limiter = RateLimitMiddleware(None, calls_per_minute=3, window_size=60)
+    now = 1_000_000.0
+
+    # Three tokens available, the fourth request is rejected
+    results = [limiter._is_rate_limited("1.2.3.4", now) for _ in range(4)]
+    assert results == [False, False, False, True]
+
+    # One window-third later a single token has refilled
+    assert limiter._is_rate_limited("1.2.3.4", now + 21) is False
+    assert limiter._is_rate_limited("1.2.3.4", now + 21) is True
+
+    # The least recently seen IP is evicted once the map is full
+    limiter.MAX_TRACKED_CLIENTS = 2
+    for ip in ("a", "b", "c"):
+        limiter._is_rate_limited(ip, now)
+    assert list(limiter.buckets) == ["b", "c"]
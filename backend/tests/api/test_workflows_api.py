@@ -66,7 +66,9 @@ def test_get_workflows():
         async def fetch_all(self, query, *args, **kwargs):
             return [
                 {"id": "123", "name": "Test Workflow",
-                    "description": "A test workflow"}
+                    "description": "A test workflow", "status": "completed",
+                    "created_at": "2023-01-01T00:00:00",
+                    "updated_at": "2023-01-01T00:00:00"}
             ]
 
     # Create a mock of the get_db function that works as an async context manager
@@ -75,7 +77,7 @@ def test_get_workflows():
         yield MockDB()
 
     # Patch the get_db function
-    with patch("app.main.get_db", return_value=mock_get_db()):
+    with patch("app.api.workflows.get_db", return_value=mock_get_db()):
         response = client.get("/workflows")
         assert response.status_code == 200
         assert isinstance(response.json(), list)
@@ -119,8 +121,7 @@ def test_get_agents():
         assert agent in agent_names
 
 
-@pytest.mark.asyncio
-async def test_execute_workflow():
+def test_execute_workflow():
     """Test that the POST /execute endpoint executes a workflow."""
     # This requires mocking the orchestrator, which we've done at the top of the file
     workflow_data = {
@@ -0,0 +1,60 @@
+"""Shared fixtures for workflow orchestrator tests."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.workflow.orchestrator import WorkflowOrchestrator, WorkflowState
+
+
+# Canned payload returned by the mock graph; built once at import so
+# arun doesn't rebuild the same dicts on every call (no test mutates it)
+_MOCK_DATA = {
+    "research_results": "Research completed",
+    "processed_data": "Data processed",
+    "approval": {"approved": True, "feedback": "Approved"},
+    "optimization": "Workflow optimized"
+}
+_MOCK_HISTORY = [
+    {"step": "research", "timestamp": "2023-01-01T00:00:00"},
+    {"step": "process", "timestamp": "2023-01-01T00:00:01"},
+    {"step": "approve", "timestamp": "2023-01-01T00:00:02"},
+    {"step": "optimize", "timestamp": "2023-01-01T00:00:03"}
+]
+
+
+# The state the mock graph resolves to, and the graph itself: an
+# AsyncMock configured once at import, so arun returns the prebuilt
+# state with no per-call construction at all
+_MOCK_STATE = WorkflowState(
+    workflow_id="00000000-0000-4000-8000-000000000001",
+    current_step="optimize",
+    data=_MOCK_DATA,
+    history=_MOCK_HISTORY
+)
+
+_mock_graph = AsyncMock()
+_mock_graph.compiled = True
+_mock_graph.arun.return_value = _MOCK_STATE
+
+
+@pytest.fixture(scope="session")
+def orchestrator():
+    """One orchestrator with a mocked graph, shared across the session.
+
+    Construction (agent setup plus the graph-build patch enter/exit)
+    used to be repeated per test; the orchestrator is stateless between
+    runs, so building it once is enough. Tests that need to stub the
+    execution path patch the instance's _execute strategy instead of
+    rebuilding.
+    """
+    # monkeypatch.setattr instead of unittest.mock.patch: no target
+    # string resolution and no MagicMock allocation on the hot
+    # collection path (the function-scoped monkeypatch fixture can't be
+    # used from a session fixture, so one is built directly)
+    mp = pytest.MonkeyPatch()
+    mp.setattr(WorkflowOrchestrator, "_build_workflow_graph",
+               lambda self: _mock_graph)
+    try:
+        yield WorkflowOrchestrator()
+    finally:
+        mp.undo()